@@ -48,6 +48,18 @@ def load_pkgs(
     os.remove(tmp.name)
 
 
+# packages required to authorize against each fsspec protocol
+_PROTOCOL_PKGS = {
+    "rsc": ["rsconnect-python"],
+    "file": [],
+    "s3": ["s3fs"],
+    "s3a": ["s3fs"],
+    "abfs": ["adlfs"],
+    "gcs": ["gcsfs"],
+    "gs": ["gcsfs"],
+}
+
+
 def get_board_pkgs(board) -> list[str]:
     """
     Extract packages required for pin board authorization
@@ -63,20 +75,18 @@ def get_board_pkgs(board) -> list[str]:
     """
     prot = board.fs.protocol
 
-    if prot == "rsc":
-        return ["rsconnect-python"]
-    elif prot == "file":
-        return []
-    elif prot == ["s3", "s3a"]:
-        return ["s3fs"]
-    elif prot == "abfs":
-        return ["adlfs"]
-    elif prot == ("gcs", "gs"):
-        return ["gcsfs"]
-    else:
+    # fsspec filesystems can expose several protocol aliases at once
+    if isinstance(prot, (list, tuple)):
+        prot = prot[0]
+
+    pkgs = _PROTOCOL_PKGS.get(prot)
+
+    if pkgs is None:
         warnings.warn(
             f"required packages unknown for board protocol: {prot}, "
             "add to model's metadata to export",
             UserWarning,
         )
         return []
+
+    return pkgs
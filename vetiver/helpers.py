@@ -1,7 +1,15 @@
 from functools import singledispatch
+import keyword
+import numpy as np
 import pandas as pd
 import pydantic
 
+orjson_exists = True
+try:
+    import orjson
+except ImportError:
+    orjson_exists = False
+
 
 @singledispatch
 def api_data_to_frame(pred_data) -> pd.DataFrame:
@@ -25,6 +33,21 @@ def api_data_to_frame(pred_data) -> pd.DataFrame:
 @api_data_to_frame.register(list)
 def _(pred_data):
 
+    if not pred_data:
+        return pd.DataFrame()
+
+    first = pred_data[0]
+    if isinstance(first, pydantic.BaseModel):
+        # build typed columns directly from model fields, rather than copying
+        # every row into a dict and letting pandas re-infer the layout
+        fields = getattr(type(first), "model_fields", None) or first.__fields__
+        data = {field: [getattr(row, field) for row in pred_data] for field in fields}
+        return pd.DataFrame(data, copy=False)
+
+    if isinstance(first, dict):
+        # pandas consumes a list of dicts directly, no per-row copy needed
+        return pd.DataFrame(pred_data)
+
     return pd.DataFrame([dict(s) for s in pred_data])
 
 
@@ -39,6 +62,75 @@ def _dict(pred_data):
     return api_data_to_frame([pred_data])
 
 
+def specialize_data_to_frame(prototype):
+    """Build a converter specialized to one prototype's fields
+
+    Parameters
+    ----------
+    prototype : pydantic.BaseModel
+        Data prototype whose fields are known ahead of serving
+
+    Returns
+    -------
+    typing.Callable
+        Function turning a list of prototype instances into a DataFrame
+
+    Notes
+    -----
+    The field names are fixed once the API is initialized, so the column
+    loops can be compiled once with direct attribute access instead of
+    re-resolving field names on every request. All-numeric prototypes are
+    fused further: rows are read straight into one float64 array that backs
+    the DataFrame as a single block, skipping per-column lists and dtype
+    inference. Prototypes whose field names are not plain identifiers, or
+    are Python keywords, fall back to `api_data_to_frame`.
+    """
+    if prototype is None:
+        return api_data_to_frame
+
+    model_fields = getattr(prototype, "model_fields", None)
+    if model_fields is not None:
+        annotations = [field.annotation for field in model_fields.values()]
+        fields = list(model_fields)
+    else:  # pydantic v1
+        annotations = [field.outer_type_ for field in prototype.__fields__.values()]
+        fields = list(prototype.__fields__)
+
+    if not fields or not all(
+        field.isidentifier() and not keyword.iskeyword(field) for field in fields
+    ):
+        return api_data_to_frame
+
+    namespace = {"pd": pd, "np": np, "_columns": fields}
+
+    if all(annotation in (int, float) for annotation in annotations):
+        attrs = ", ".join(f"row.{field}" for field in fields)
+        source = (
+            "def _to_frame(rows):\n"
+            f"    values = np.fromiter(\n"
+            f"        (value for row in rows for value in ({attrs},)),\n"
+            f"        dtype=np.float64,\n"
+            f"        count=len(rows) * {len(fields)},\n"
+            f"    )\n"
+            f"    return pd.DataFrame(\n"
+            f"        values.reshape(len(rows), {len(fields)}),\n"
+            f"        columns=_columns,\n"
+            f"        copy=False,\n"
+            f"    )"
+        )
+    else:
+        columns = ", ".join(
+            f"{field!r}: [row.{field} for row in rows]" for field in fields
+        )
+        source = (
+            f"def _to_frame(rows):\n    return pd.DataFrame({{{columns}}}, copy=False)"
+        )
+
+    exec(source, namespace)
+
+    return namespace["_to_frame"]
+
+
 def response_to_frame(response: dict) -> pd.DataFrame:
     """Convert API JSON response to data frame
 
@@ -52,6 +144,9 @@ def response_to_frame(response: dict) -> pd.DataFrame:
     pd.DataFrame
         Response translated into DataFrame
     """
-    response_df = pd.DataFrame.from_dict(response.json())
+    if orjson_exists:
+        response_df = pd.DataFrame.from_dict(orjson.loads(response.content))
+    else:
+        response_df = pd.DataFrame.from_dict(response.json())
 
     return response_df
@@ -1,11 +1,16 @@
 from .vetiver_model import VetiverModel
 from .meta import VetiverMeta
-from .utils import inform, serialize_prototype
+from .utils import inform, serialize_prototype, _dump_cloudpickle, cloudpickle_exists
+import joblib
+import os
+import tempfile
 import warnings
 import logging
 
 _log = logging.getLogger(__name__)
 
+_pin_read_warned = False
+
 
 class ModelCard(UserWarning):
     def __init__(
@@ -19,7 +24,13 @@ class ModelCard(UserWarning):
         super().__init__(self.message)
 
 
-def vetiver_pin_write(board, model: VetiverModel, versioned: bool = True):
+def vetiver_pin_write(
+    board,
+    model: VetiverModel,
+    versioned: bool = True,
+    serializer: str = "joblib",
+    compress=None,
+):
     """
     Pin a trained VetiverModel along with other model metadata.
 
@@ -31,6 +42,18 @@ def vetiver_pin_write(board, model: VetiverModel, versioned: bool = True):
         VetiverModel to be written to board
     versioned: bool
         Whether or not the pin should be versioned
+    serializer: str
+        How the model should be serialized, either "joblib" (default) or
+        "cloudpickle". The "cloudpickle" option pickles at protocol 5 with
+        out-of-band buffers, so large model arrays are written without an
+        intermediate copy and are memory-mapped at read time. Versioning for
+        "cloudpickle" pins follows the board's own setting.
+    compress:
+        Compression for the "joblib" serializer, passed to `joblib.dump`,
+        such as `3` or `("lz4", 3)`. Uncompressed pins (`compress=0`) are
+        memory-mapped at read time, so workers share the model arrays;
+        compressed pins produce smaller payloads but cannot be mapped.
+        Versioning follows the board's own setting when compress is used.
 
     Examples
     --------
@@ -52,44 +75,89 @@ def vetiver_pin_write(board, model: VetiverModel, versioned: bool = True):
             "allow_pickle_read to True on board creation."
         )
 
-    inform(
-        _log,
-        "Model Cards provide a framework for transparent, responsible "
-        "reporting. \n Use the vetiver `.qmd` Quarto template as a place to start, \n "
-        "with vetiver.model_card()",
-    )
-
-    # convert older model's ptype to prototype
-    if hasattr(model, "ptype"):
-        model.prototype = model.ptype
-        delattr(model, "ptype")
-    # metadata is dict
-    if isinstance(model.metadata, dict):
-        model.metadata = VetiverMeta.from_dict(model.metadata)
-
-    board.pin_write(
-        model.model,
-        name=model.model_name,
-        type="joblib",
-        description=model.description,
-        metadata={
-            "user": model.metadata.user,
-            "vetiver_meta": {
-                "required_pkgs": model.metadata.required_pkgs,
-                "prototype": (
-                    None
-                    if not model.prototype
-                    else serialize_prototype(model.prototype)
-                ),
-                "python_version": (
-                    None
-                    if not model.metadata.python_version
-                    else list(model.metadata.python_version)
-                ),
-            },
+    # run legacy conversions (and the model card reminder) once per model,
+    # so repeated writes of the same object skip the introspection
+    if not getattr(model, "_vetiver_migrated", False):
+        inform(
+            _log,
+            "Model Cards provide a framework for transparent, responsible "
+            "reporting. \n Use the vetiver `.qmd` Quarto template as a place to start, \n "  # noqa: E501
+            "with vetiver.model_card()",
+        )
+
+        # convert older model's ptype to prototype
+        if hasattr(model, "ptype"):
+            model.prototype = model.ptype
+            delattr(model, "ptype")
+        # metadata is dict
+        if isinstance(model.metadata, dict):
+            model.metadata = VetiverMeta.from_dict(model.metadata)
+
+        model._vetiver_migrated = True
+
+    metadata = {
+        "user": model.metadata.user,
+        "vetiver_meta": {
+            "required_pkgs": model.metadata.required_pkgs,
+            "prototype": (
+                None if not model.prototype else serialize_prototype(model.prototype)
+            ),
+            "python_version": (
+                None
+                if not model.metadata.python_version
+                else list(model.metadata.python_version)
+            ),
         },
-        versioned=versioned,
-    )
+    }
+
+    if serializer == "cloudpickle":
+        if compress is not None:
+            raise ValueError(
+                "compress is only supported with the 'joblib' serializer."
+            )
+        if not cloudpickle_exists:
+            raise ImportError(
+                "cloudpickle is not installed. Install cloudpickle to use "
+                'serializer="cloudpickle".'
+            )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pkl_file = os.path.join(tmpdir, f"{model.model_name}.pkl")
+            payload_size, buffer_sizes = _dump_cloudpickle(model.model, pkl_file)
+            metadata["vetiver_meta"]["serializer"] = "cloudpickle"
+            metadata["vetiver_meta"]["payload_size"] = payload_size
+            metadata["vetiver_meta"]["buffer_sizes"] = buffer_sizes
+            board.pin_upload(
+                pkl_file,
+                name=model.model_name,
+                description=model.description,
+                metadata=metadata,
+            )
+    elif serializer == "joblib":
+        if compress is None:
+            board.pin_write(
+                model.model,
+                name=model.model_name,
+                type="joblib",
+                description=model.description,
+                metadata=metadata,
+                versioned=versioned,
+            )
+        else:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                joblib_file = os.path.join(tmpdir, f"{model.model_name}.joblib")
+                joblib.dump(model.model, joblib_file, compress=compress, protocol=5)
+                metadata["vetiver_meta"]["serializer"] = "joblib"
+                metadata["vetiver_meta"]["compress"] = bool(compress)
+                board.pin_upload(
+                    joblib_file,
+                    name=model.model_name,
+                    description=model.description,
+                    metadata=metadata,
+                )
+    else:
+        raise ValueError(
+            f"Unknown serializer: {serializer}. Use 'joblib' or 'cloudpickle'."
+        )
 
 
 def vetiver_pin_read(board, name: str, version: str = None) -> VetiverModel:
@@ -115,12 +183,18 @@ def vetiver_pin_read(board, name: str, version: str = None) -> VetiverModel:
     "username/modelname" format.
 
     """
-
-    warnings.warn(
-        "vetiver_pin_read will be removed in v1.0.0. Use classmethod "
-        "VetiverModel.from_pin() instead",
-        DeprecationWarning,
-    )
+    global _pin_read_warned
+
+    # warn once per process; workers reloading models in a loop should not
+    # pay the warning-machinery cost on every call
+    if not _pin_read_warned:
+        warnings.warn(
+            "vetiver_pin_read will be removed in v1.0.0. Use classmethod "
+            "VetiverModel.from_pin() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        _pin_read_warned = True
 
     v = VetiverModel.from_pin(board=board, name=name, version=version)
 
@@ -1,26 +1,116 @@
+import asyncio
+import importlib.util
 import json
 import logging
 import re
 import webbrowser
 from textwrap import dedent
-from typing import Callable, List, Union
+from typing import Any, Callable, Dict, List, Union
 from urllib.parse import urljoin
 from warnings import warn
 
 import httpx
+import numpy as np
 import pandas as pd
 import requests
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse, PlainTextResponse, RedirectResponse
-
-from .helpers import api_data_to_frame, response_to_frame
+from fastapi.responses import (
+    HTMLResponse,
+    ORJSONResponse,
+    PlainTextResponse,
+    RedirectResponse,
+    Response,
+)
+from starlette.concurrency import run_in_threadpool
+
+from .helpers import response_to_frame, specialize_data_to_frame
 from .meta import VetiverMeta
 from .utils import _jupyter_nb, get_workbench_path
 from .vetiver_model import VetiverModel
 
+orjson_exists = True
+try:
+    import orjson
+except ImportError:
+    orjson_exists = False
+
+ormsgpack_exists = True
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack_exists = False
+
+_RAPIDOC_TEMPLATE = """
+        <!doctype html>
+        <html>
+            <head>
+            <meta name="viewport"
+            content="width=device-width,minimum-scale=1,initial-scale=1,user-scalable=yes">
+            <title>RapiDoc</title>
+            <script type="module"
+            src="https://unpkg.com/rapidoc@9.3.3/dist/rapidoc-min.js"></script>
+            </script></head>
+            <body>
+                <rapi-doc spec-url="{spec_url}"
+                id="thedoc"
+                render-style="read"
+                schema-style="tree"
+                show-components="true"
+                show-info="true"
+                show-header="true"
+                allow-search="true"
+                show-side-nav="false"
+                allow-authentication="false"
+                update-route="false"
+                match-type="regex"
+                theme="light"
+                header-color="#F2C6AC"
+                primary-color = "#8C2D2D">
+                <img
+                slot="logo"
+                width="55"
+                src="https://raw.githubusercontent.com/rstudio/hex-stickers/master/SVG/vetiver.svg"
+                </rapi-doc>
+            </body>
+        </html>
+"""
+
+# one prebuilt response shared by every liveness probe; no per-request
+# dict allocation or serialization
+_PONG = Response(
+    content=b'{"ping":"pong"}',
+    media_type="application/json",
+    headers={"Cache-Control": "no-store"},
+)
+
+
+def _predictions_response(endpoint_name: str, predictions):
+    """Build the response for a POST endpoint's predictions
+
+    List and array predictions are returned as an ORJSONResponse when orjson
+    is available, which serializes NumPy natively and skips FastAPI's
+    per-element jsonable_encoder pass over the output.
+    """
+    if isinstance(predictions, (list, np.ndarray)):
+        if orjson_exists:
+            return ORJSONResponse({endpoint_name: predictions})
+        if isinstance(predictions, np.ndarray):
+            predictions = predictions.tolist()
+        return {endpoint_name: predictions}
+    else:
+        return predictions
+
+
+# reuse one pooled session across predict() calls, saving a TCP/TLS
+# handshake per call against the same endpoint
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 class VetiverAPI:
     """Create model aware API
@@ -35,6 +125,13 @@ class VetiverAPI:
         Determine if data prototype should be enforced
     app_factory :
         Type of API to be deployed
+    max_batch_size : int
+        If set, concurrent requests to `/predict` are coalesced into batches
+        of at most this many rows, served with one call to the model. Requires
+        `check_prototype=True`.
+    batch_timeout_ms : float
+        How long a partial batch waits for more requests before being served,
+        in milliseconds. Only used when `max_batch_size` is set.
     **kwargs: dict
         Deprecated parameters.
 
@@ -58,9 +155,14 @@ class VetiverAPI:
     ├──/metadata (GET)
     ├──/prototype (GET, if `show_prototype` is True)
     ├──/pin-url (GET, if VetiverModel metadata `url` field is not None)
-    └──/predict (POST)
+    ├──/predict (POST)
+    └──/predict/columnar (POST)
     ```
 
+    `/predict` accepts a JSON array of rows and validates it against a single
+    `List` schema, so one validator serves both cases; a single-row request
+    is simply a batch of one.
+
     Parameter `check_ptype` was changed to `check_prototype`. Handling of `check_ptype`
     will be removed in a future version.
     """
@@ -73,12 +175,26 @@ class VetiverAPI:
         show_prototype: bool = True,
         check_prototype: bool = True,
         app_factory=FastAPI,
+        max_batch_size: int = None,
+        batch_timeout_ms: float = 10,
         **kwargs,
     ) -> None:
         self.model = model
         self.app_factory = app_factory
-        self.app = app_factory()
+        if orjson_exists:
+            try:
+                self.app = app_factory(default_response_class=ORJSONResponse)
+            except TypeError:
+                # custom app factories may not take response class kwargs
+                self.app = app_factory()
+        else:
+            self.app = app_factory()
         self.workbench_path = None
+        self.max_batch_size = max_batch_size
+        self.batch_timeout_ms = batch_timeout_ms
+        self._batch_queue = None
+        self._batch_task = None
+        self._batch_loop = None
 
         if "check_ptype" in kwargs:
             check_prototype = kwargs.pop("check_ptype")
@@ -95,6 +211,12 @@ class VetiverAPI:
         self.show_prototype = show_prototype
         self.check_prototype = check_prototype
 
+        if max_batch_size is not None and not check_prototype:
+            raise ValueError(
+                "batched prediction requires a data prototype. Set "
+                "check_prototype to True to use max_batch_size."
+            )
+
         self._init_app()
 
     def _init_app(self):
@@ -128,12 +250,30 @@ class VetiverAPI:
         @app.get("/ping", include_in_schema=True)
         async def ping():
             """Ping endpoint for health check"""
-            return {"ping": "pong"}
+            return _PONG
+
+        # metadata is static per process, so serialize it once
+        metadata_dict = self.model.metadata.to_dict()
+        metadata_response = None
+        if orjson_exists:
+            try:
+                metadata_response = Response(
+                    content=orjson.dumps(
+                        metadata_dict, option=orjson.OPT_SERIALIZE_NUMPY
+                    ),
+                    media_type="application/json",
+                )
+            except TypeError:
+                # user metadata with types orjson does not know; serve the
+                # dict per request through FastAPI's encoder instead
+                metadata_response = None
 
         @app.get("/metadata")
         async def get_metadata():
             """Get metadata from model"""
-            return self.model.metadata.to_dict()
+            if metadata_response is not None:
+                return metadata_response
+            return metadata_dict
 
         if self.show_prototype is True:
 
@@ -152,52 +292,96 @@ class VetiverAPI:
                     value.pop("title", None)
                 return prototype_schema
 
-        self.vetiver_post(
-            self.model.handler_predict, "predict", check_prototype=self.check_prototype
-        )
+        if self.max_batch_size is not None:
+            self._init_batched_predict()
+        else:
+            self.vetiver_post(
+                self.model.handler_predict,
+                "predict",
+                check_prototype=self.check_prototype,
+            )
+
+        @app.post("/predict/columnar", name="predict_columnar")
+        async def predict_columnar(input_data: Dict[str, List[Any]]):
+            """Columnar variant of /predict
+
+            Accepts one list of values per column, such as
+            `{"B": [1, 1], "C": [2, 2], "D": [3, 3]}`, which maps onto
+            DataFrame columns without building row objects first.
+            """
+            try:
+                if self.check_prototype:
+                    fields = list(
+                        getattr(self.model.prototype, "model_fields", None)
+                        or self.model.prototype.__fields__
+                    )
+                    if set(input_data) != set(fields):
+                        return PlainTextResponse(
+                            f"column names must match prototype fields: {fields}",
+                            status_code=422,
+                        )
+                    frame = pd.DataFrame(
+                        {field: input_data[field] for field in fields}, copy=False
+                    )
+                else:
+                    frame = pd.DataFrame(input_data, copy=False)
+            except ValueError as e:
+                return PlainTextResponse(str(e), status_code=422)
+
+            y = await run_in_threadpool(
+                self.model.handler_predict, frame, self.check_prototype
+            )
+            return _predictions_response("predict", y)
+
+        if ormsgpack_exists:
+
+            @app.post("/predict/msgpack", name="predict_msgpack")
+            async def predict_msgpack(request: Request):
+                """Msgpack variant of /predict for trusted internal callers
+
+                Accepts a msgpack-encoded list of row mappings, or a mapping
+                of one list of values per column. Rows are not validated
+                against the prototype, so only expose this endpoint to
+                callers whose payloads are known to be well formed.
+                """
+                body = await request.body()
+                try:
+                    data = ormsgpack.unpackb(body)
+                    frame = pd.DataFrame(data, copy=False)
+                    if self.check_prototype:
+                        fields = list(
+                            getattr(self.model.prototype, "model_fields", None)
+                            or self.model.prototype.__fields__
+                        )
+                        frame = frame[fields]
+                except (ValueError, KeyError) as e:
+                    return PlainTextResponse(str(e), status_code=422)
+
+                y = await run_in_threadpool(
+                    self.model.handler_predict, frame, self.check_prototype
+                )
+                if isinstance(y, np.ndarray):
+                    y = y.tolist()
+                return Response(
+                    content=ormsgpack.packb({"predict": y}),
+                    media_type="application/msgpack",
+                )
+
+        # render once at startup; the spec url never changes after init
+        rapidoc_html = _RAPIDOC_TEMPLATE.format(spec_url=self.app.openapi_url[1:])
 
         @app.get("/__docs__", response_class=HTMLResponse, include_in_schema=False)
         async def rapidoc():
-            # save as html html.tpl, .format {spec_url}
-            return f"""
-                    <!doctype html>
-                    <html>
-                        <head>
-                        <meta name="viewport"
-                        content="width=device-width,minimum-scale=1,initial-scale=1,user-scalable=yes">
-                        <title>RapiDoc</title>
-                        <script type="module"
-                        src="https://unpkg.com/rapidoc@9.3.3/dist/rapidoc-min.js"></script>
-                        </script></head>
-                        <body>
-                            <rapi-doc spec-url="{self.app.openapi_url[1:]}"
-                            id="thedoc"
-                            render-style="read"
-                            schema-style="tree"
-                            show-components="true"
-                            show-info="true"
-                            show-header="true"
-                            allow-search="true"
-                            show-side-nav="false"
-                            allow-authentication="false"
-                            update-route="false"
-                            match-type="regex"
-                            theme="light"
-                            header-color="#F2C6AC"
-                            primary-color = "#8C2D2D">
-                            <img
-                            slot="logo"
-                            width="55"
-                            src="https://raw.githubusercontent.com/rstudio/hex-stickers/master/SVG/vetiver.svg"
-                            </rapi-doc>
-                        </body>
-                    </html>
-            """
+            return rapidoc_html
 
         @app.exception_handler(RequestValidationError)
         async def validation_exception_handler(request, exc):
             return PlainTextResponse(str(exc), status_code=422)
 
+        # build the schema now that the routes exist, so the first
+        # /openapi.json hit does not pay for the route walk
+        self._build_openapi()
+
         return app
 
     def vetiver_post(self, endpoint_fx: Callable, endpoint_name: str = None, **kw):
@@ -206,7 +390,10 @@ class VetiverAPI:
         Parameters
         ----------
         endpoint_fx : typing.Callable
-            Custom function to be run at endpoint
+            Custom function to be run at endpoint. When a prototype is
+            enforced, it receives the request rows as one DataFrame, built
+            by a converter specialized to the prototype; no intermediate
+            per-request Series or row objects are created.
         endpoint_name : str
             Name of endpoint
 
@@ -234,6 +421,7 @@ class VetiverAPI:
             api_desc = None
 
         if self.check_prototype is True:
+            to_frame = specialize_data_to_frame(self.model.prototype)
 
             @self.app.post(
                 urljoin("/", endpoint_name),
@@ -241,24 +429,113 @@ class VetiverAPI:
                 description=api_desc,
             )
             async def custom_endpoint(input_data: List[self.model.prototype]):
-                _to_frame = api_data_to_frame(input_data)
-                predictions = endpoint_fx(_to_frame, **kw)
-                if isinstance(predictions, List):
-                    return {endpoint_name: predictions}
-                else:
-                    return predictions
+                _to_frame = to_frame(input_data)
+                # run CPU-bound model code off the event loop, so other
+                # requests can be parsed while a prediction is in flight
+                predictions = await run_in_threadpool(endpoint_fx, _to_frame, **kw)
+                return _predictions_response(endpoint_name, predictions)
 
         else:
 
             @self.app.post(urljoin("/", endpoint_name))
             async def custom_endpoint(input_data: Request):
                 served_data = await input_data.json()
-                predictions = endpoint_fx(served_data, **kw)
+                predictions = await run_in_threadpool(endpoint_fx, served_data, **kw)
+                return _predictions_response(endpoint_name, predictions)
 
-                if isinstance(predictions, List):
-                    return {endpoint_name: predictions}
-                else:
-                    return predictions
+        # refresh the precomputed schema to include the new route
+        self._build_openapi()
+
+    def _init_batched_predict(self):
+        """Create a /predict endpoint that coalesces concurrent requests
+
+        Incoming rows are queued and served together with a single call to
+        `handler_predict`, so concurrent traffic is predicted as one larger
+        batch instead of one model call per request.
+        """
+        app = self.app
+        to_frame = specialize_data_to_frame(self.model.prototype)
+
+        @app.on_event("startup")
+        async def start_batch_worker():
+            self._start_batch_worker()
+
+        @app.on_event("shutdown")
+        async def stop_batch_worker():
+            if self._batch_task is not None:
+                self._batch_task.cancel()
+                self._batch_task = None
+
+        @app.post(urljoin("/", "predict"), name="predict")
+        async def batched_endpoint(input_data: List[self.model.prototype]):
+            if (
+                self._batch_queue is None
+                or self._batch_loop is not asyncio.get_running_loop()
+            ):
+                # TestClient may call endpoints without running startup events,
+                # and may use a fresh event loop per request
+                self._start_batch_worker()
+            _to_frame = to_frame(input_data)
+            future = asyncio.get_running_loop().create_future()
+            await self._batch_queue.put((_to_frame, future))
+            predictions = await future
+            return _predictions_response("predict", predictions)
+
+    def _start_batch_worker(self):
+        self._batch_loop = asyncio.get_event_loop()
+        self._batch_queue = asyncio.Queue()
+        self._batch_task = self._batch_loop.create_task(self._batch_worker())
+
+    async def _batch_worker(self):
+        loop = asyncio.get_running_loop()
+        timeout = self.batch_timeout_ms / 1000
+
+        while True:
+            frame, future = await self._batch_queue.get()
+            frames, futures = [frame], [future]
+            deadline = loop.time() + timeout
+
+            # wait briefly for more requests, up to max_batch_size rows
+            while sum(len(frame) for frame in frames) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    frame, future = await asyncio.wait_for(
+                        self._batch_queue.get(), remaining
+                    )
+                except asyncio.TimeoutError:
+                    break
+                frames.append(frame)
+                futures.append(future)
+
+            # any failure here must reach the waiting requests; an escaped
+            # exception would kill the worker and wedge every later request
+            try:
+                batch = (
+                    pd.concat(frames, ignore_index=True)
+                    if len(frames) > 1
+                    else frames[0]
+                )
+                predictions = list(
+                    await run_in_threadpool(
+                        self.model.handler_predict,
+                        batch,
+                        check_prototype=self.check_prototype,
+                    )
+                )
+
+                # hand each request its own slice of the batched prediction
+                start = 0
+                for frame, future in zip(frames, futures):
+                    stop = start + len(frame)
+                    if not future.done():
+                        future.set_result(predictions[start:stop])
+                    start = stop
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
 
     def run(self, port: int = 8000, host: str = "127.0.0.1", quiet_open=False, **kw):
         """
@@ -289,6 +566,14 @@ class VetiverAPI:
         """
         _jupyter_nb()
         self.workbench_path = get_workbench_path(port)
+
+        # prefer uvloop's event loop and httptools' HTTP parser when they are
+        # installed; both cut per-request overhead for small payloads
+        if "loop" not in kw and importlib.util.find_spec("uvloop") is not None:
+            kw["loop"] = "uvloop"
+        if "http" not in kw and importlib.util.find_spec("httptools") is not None:
+            kw["http"] = "httptools"
+
         if port and host:
             try:
                 if host == "127.0.0.1" and not quiet_open:
@@ -303,11 +588,9 @@ class VetiverAPI:
         else:
             uvicorn.run(self.app, port=port, host=host, **kw)
 
-    def _custom_openapi(self):
+    def _build_openapi(self):
         import vetiver
 
-        if self.app.openapi_schema:
-            return self.app.openapi_schema
         openapi_schema = get_openapi(
             title=self.model.model_name + " model API",
             version=vetiver.__version__,
@@ -320,6 +603,12 @@ class VetiverAPI:
 
         return self.app.openapi_schema
 
+    def _custom_openapi(self):
+        if self.app.openapi_schema:
+            return self.app.openapi_schema
+
+        return self._build_openapi()
+
 
 def predict(endpoint, data: Union[dict, pd.DataFrame, pd.Series], **kw) -> pd.DataFrame:
     """Make a prediction from model endpoint
@@ -359,21 +648,42 @@ def predict(endpoint, data: Union[dict, pd.DataFrame, pd.Series], **kw) -> pd.Da
     if "test_client" in kw:
         requester = kw.pop("test_client")
     else:
-        requester = requests
+        requester = _session
 
     # TO DO: arrow format
     # TO DO: dispatch
 
     if isinstance(data, pd.DataFrame):
-        response = requester.post(
-            endpoint, data=data.to_json(orient="records"), **kw
-        )  # TO DO: httpx deprecating data in favor of content for TestClient
+        records = data.to_dict(orient="records")
     elif isinstance(data, pd.Series):
-        response = requester.post(endpoint, json=[data.to_dict()], **kw)
+        records = [data.to_dict()]
     elif isinstance(data, dict):
-        response = requester.post(endpoint, json=[data], **kw)
+        records = [data]
+    else:
+        records = data
+
+    body = None
+    if orjson_exists:
+        try:
+            body = orjson.dumps(
+                records,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # types orjson does not know, such as Timestamps; use the
+            # pandas/stdlib encoders below instead
+            body = None
+
+    if body is not None:
+        headers = dict(kw.pop("headers", None) or {})
+        headers.setdefault("Content-Type", "application/json")
+        response = requester.post(
+            endpoint, data=body, headers=headers, **kw
+        )  # TO DO: httpx deprecating data in favor of content for TestClient
+    elif isinstance(data, pd.DataFrame):
+        response = requester.post(endpoint, data=data.to_json(orient="records"), **kw)
     else:
-        response = requester.post(endpoint, json=data, **kw)
+        response = requester.post(endpoint, json=records, **kw)
 
     try:
         response.raise_for_status()
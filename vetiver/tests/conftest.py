@@ -12,7 +12,7 @@ def sum_values_no_prototype(x):
     return api_data_to_frame(x).sum().to_list()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(model: VetiverModel) -> TestClient:
     app = VetiverAPI(model, check_prototype=True)
     app.vetiver_post(sum_values, "sum")
@@ -21,7 +21,7 @@ def client(model: VetiverModel) -> TestClient:
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client_no_prototype(model: VetiverModel) -> TestClient:
     app = VetiverAPI(model, check_prototype=False)
     app.vetiver_post(sum_values_no_prototype, "sum")
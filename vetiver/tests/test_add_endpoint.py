@@ -3,7 +3,7 @@ import pandas as pd
 from vetiver import mock, VetiverModel
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def model():
     X, y = mock.get_mock_data()
     model = mock.get_mock_model()
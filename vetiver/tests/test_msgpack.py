@@ -0,0 +1,37 @@
+import pytest
+
+ormsgpack = pytest.importorskip("ormsgpack", reason="ormsgpack library not installed")
+
+import numpy as np  # noqa
+from vetiver import mock, VetiverModel  # noqa
+
+
+@pytest.fixture(scope="module")
+def model():
+    np.random.seed(500)
+    X, y = mock.get_mock_data()
+    model = mock.get_mock_model().fit(X, y)
+
+    return VetiverModel(model, "model", prototype_data=X)
+
+
+def test_predict_msgpack_rows(client):
+    rows = [{"B": 1, "C": 2, "D": 3}, {"B": 1, "C": 2, "D": 3}]
+    response = client.post("/predict/msgpack", content=ormsgpack.packb(rows))
+
+    assert response.status_code == 200, response.text
+    assert len(ormsgpack.unpackb(response.content)["predict"]) == 2
+
+
+def test_predict_msgpack_columnar(client):
+    cols = {"B": [1, 1], "C": [2, 2], "D": [3, 3]}
+    response = client.post("/predict/msgpack", content=ormsgpack.packb(cols))
+
+    assert response.status_code == 200, response.text
+    assert len(ormsgpack.unpackb(response.content)["predict"]) == 2
+
+
+def test_predict_msgpack_bad_body(client):
+    response = client.post("/predict/msgpack", content=b"not msgpack")
+
+    assert response.status_code == 422, response.text
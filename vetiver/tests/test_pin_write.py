@@ -26,3 +26,72 @@ def test_board_pin_write():
     vetiver_pin_write(board=board, model=v)
     assert isinstance(board.pin_read("model"), sklearn.dummy.DummyRegressor)
     board.pin_delete("model")
+
+
+def test_board_pin_write_cloudpickle():
+    pytest.importorskip("cloudpickle", reason="cloudpickle library not installed")
+    v = VetiverModel(
+        model=model, prototype_data=X_df, model_name="model", versioned=None
+    )
+    board = pins.board_temp(allow_pickle_read=True)
+    vetiver_pin_write(board=board, model=v, serializer="cloudpickle")
+    v2 = VetiverModel.from_pin(board, "model")
+    assert isinstance(v2.model, sklearn.dummy.DummyRegressor)
+    assert v2.model.predict(X_df)[0] == v.model.predict(X_df)[0]
+    board.pin_delete("model")
+
+
+def test_board_pin_read_cloudpickle_no_pickle_allowed(tmp_path, monkeypatch):
+    pytest.importorskip("cloudpickle", reason="cloudpickle library not installed")
+    monkeypatch.delenv("PINS_ALLOW_PICKLE_READ", raising=False)
+    v = VetiverModel(
+        model=model, prototype_data=X_df, model_name="model", versioned=None
+    )
+    board = pins.board_folder(str(tmp_path), allow_pickle_read=True)
+    vetiver_pin_write(board=board, model=v, serializer="cloudpickle")
+    locked_board = pins.board_folder(str(tmp_path))
+    with pytest.raises(pins.errors.PinsInsecureReadError):
+        VetiverModel.from_pin(locked_board, "model")
+
+
+@pytest.mark.parametrize("compress", [0, 3])
+def test_board_pin_write_compress(compress):
+    v = VetiverModel(
+        model=model, prototype_data=X_df, model_name="model", versioned=None
+    )
+    board = pins.board_temp(allow_pickle_read=True)
+    vetiver_pin_write(board=board, model=v, compress=compress)
+    v2 = VetiverModel.from_pin(board, "model")
+    assert isinstance(v2.model, sklearn.dummy.DummyRegressor)
+    assert v2.model.predict(X_df)[0] == v.model.predict(X_df)[0]
+    board.pin_delete("model")
+
+
+def test_board_pin_read_compress_no_pickle_allowed(tmp_path, monkeypatch):
+    monkeypatch.delenv("PINS_ALLOW_PICKLE_READ", raising=False)
+    v = VetiverModel(
+        model=model, prototype_data=X_df, model_name="model", versioned=None
+    )
+    board = pins.board_folder(str(tmp_path), allow_pickle_read=True)
+    vetiver_pin_write(board=board, model=v, compress=3)
+    locked_board = pins.board_folder(str(tmp_path))
+    with pytest.raises(pins.errors.PinsInsecureReadError):
+        VetiverModel.from_pin(locked_board, "model")
+
+
+def test_board_pin_write_compress_cloudpickle_error():
+    v = VetiverModel(
+        model=model, prototype_data=X_df, model_name="model", versioned=None
+    )
+    board = pins.board_temp(allow_pickle_read=True)
+    with pytest.raises(ValueError):
+        vetiver_pin_write(board=board, model=v, serializer="cloudpickle", compress=3)
+
+
+def test_board_pin_write_unknown_serializer():
+    v = VetiverModel(
+        model=model, prototype_data=X_df, model_name="model", versioned=None
+    )
+    board = pins.board_temp(allow_pickle_read=True)
+    with pytest.raises(ValueError):
+        vetiver_pin_write(board=board, model=v, serializer="pickle")
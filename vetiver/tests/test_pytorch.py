@@ -11,7 +11,7 @@ from vetiver import VetiverModel, VetiverAPI, predict  # noqa
 import vetiver  # noqa
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def build_torch():
     torch.manual_seed(3)
 
@@ -43,7 +43,7 @@ def build_torch():
     return x_train, torch_model
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model(build_torch):
 
     x_train, torch_model = build_torch
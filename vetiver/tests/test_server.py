@@ -10,11 +10,12 @@ from vetiver import (
 from pydantic import BaseModel, conint
 from fastapi.testclient import TestClient
 import numpy as np
+import pandas as pd
 import pytest
 import sys
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model():
     np.random.seed(500)
     X, y = mock.get_mock_data()
@@ -29,7 +30,7 @@ def model():
     return v
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def complex_prototype_client():
     np.random.seed(500)
 
@@ -77,6 +78,24 @@ def test_get_metadata(client):
     }
 
 
+def test_get_metadata_numpy_values():
+    np.random.seed(500)
+    X, y = mock.get_mock_data()
+    sk_model = mock.get_mock_model().fit(X, y)
+    v = VetiverModel(
+        sk_model,
+        "model",
+        prototype_data=X,
+        metadata={"accuracy": np.float64(0.99)},
+    )
+    client = TestClient(VetiverAPI(v).app)
+
+    response = client.get("/metadata")
+
+    assert response.status_code == 200, response.text
+    assert response.json()["user"] == {"accuracy": 0.99}
+
+
 def test_get_prototype(client, model):
     response = client.get("/prototype")
     assert response.status_code == 200, response.text
@@ -120,6 +139,91 @@ def test_predict_wrong_input(client):
         predict(endpoint="/predict/", data=[{"B": 43, "C": 43}], test_client=client)
 
 
+def test_predict_columnar(client):
+    response = client.post(
+        "/predict/columnar", json={"B": [1, 1], "C": [2, 2], "D": [3, 3]}
+    )
+    assert response.status_code == 200, response.text
+    assert len(response.json()["predict"]) == 2
+
+
+def test_predict_columnar_wrong_columns(client):
+    response = client.post("/predict/columnar", json={"B": [1], "Z": [1]})
+    assert response.status_code == 422, response.text
+
+
+def test_predict_datetime_column(client_no_prototype):
+    df = pd.DataFrame(
+        {
+            "B": [1, 1, 1],
+            "C": [2, 2, 2],
+            "D": pd.to_datetime(["2021-01-01", "2021-01-02", "2021-01-03"]),
+        }
+    )
+
+    response = predict(endpoint="/predict/", data=df, test_client=client_no_prototype)
+
+    assert len(response) == 3
+
+
+def test_predict_keyword_column():
+    np.random.seed(500)
+    X, y = mock.get_mock_data()
+    X = X.rename(columns={"B": "class"})
+    sk_model = mock.get_mock_model().fit(X, y)
+    v = VetiverModel(sk_model, "model", prototype_data=X)
+    client = TestClient(VetiverAPI(v, check_prototype=True).app)
+
+    response = predict(endpoint="/predict/", data=X.head(3), test_client=client)
+
+    assert len(response) == 3
+
+
+def test_batched_predict(model):
+    api = VetiverAPI(model, check_prototype=True, max_batch_size=8, batch_timeout_ms=1)
+    client = TestClient(api.app)
+    np.random.seed(500)
+    X, y = mock.get_mock_data()
+
+    response = predict(endpoint="/predict/", data=X.head(5), test_client=client)
+
+    assert isinstance(response, pd.DataFrame)
+    assert len(response) == 5
+
+
+def test_batched_predict_recovers_after_error():
+    np.random.seed(500)
+    X, y = mock.get_mock_data()
+    sk_model = mock.get_mock_model().fit(X, y)
+    v = VetiverModel(sk_model, "model", prototype_data=X)
+    api = VetiverAPI(v, check_prototype=True, max_batch_size=8, batch_timeout_ms=1)
+
+    real_predict = v.handler_predict
+    calls = []
+
+    def flaky_predict(input_data, check_prototype):
+        calls.append(len(input_data))
+        if len(calls) == 1:
+            raise RuntimeError("model exploded")
+        return real_predict(input_data, check_prototype=check_prototype)
+
+    v.handler_predict = flaky_predict
+
+    # context manager keeps one event loop, so both requests hit one worker
+    with TestClient(api.app, raise_server_exceptions=False) as client:
+        failed = client.post("/predict", json=X.head(2).to_dict(orient="records"))
+        assert failed.status_code == 500
+
+        # the worker must survive the failed batch and serve the next request
+        response = predict(endpoint="/predict/", data=X.head(3), test_client=client)
+        assert len(response) == 3
+
+
+def test_batched_predict_requires_prototype(model):
+    with pytest.raises(ValueError):
+        VetiverAPI(model, check_prototype=False, max_batch_size=8)
+
+
 def test_vetiver_endpoint():
     url_raw = "http://127.0.0.1:8000/predict/"
     url = vetiver_endpoint(url_raw)
@@ -9,7 +9,7 @@ np.random.seed(500)
 X, y = mock.get_mock_data()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model() -> VetiverModel:
     np.random.seed(500)
     model = mock.get_mock_model().fit(X, y)
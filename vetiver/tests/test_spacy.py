@@ -31,12 +31,12 @@ matcher.add("ANIMAL", animals)
 nlp.add_pipe("animals")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def spacy_model():
     return nlp
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model(spacy_model) -> TestClient:
     df = pd.DataFrame({"new_column": ["one", "two", "three"]})
     return vetiver.VetiverModel(spacy_model, "animals", prototype_data=df)
@@ -13,7 +13,7 @@ from fastapi.testclient import TestClient  # noqa
 import vetiver  # noqa
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model():
 
     X, y = vetiver.get_mock_data()
@@ -13,7 +13,7 @@ import vetiver  # noqa
 PREDICT_VALUE = 19.963224411010742
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model():
     # read in data
     dtrain = xgb.DMatrix(mtcars.drop(columns="mpg"), label=mtcars["mpg"])
@@ -2,10 +2,19 @@ import nest_asyncio
 import warnings
 import sys
 import os
+import mmap
+import pickle
 import subprocess
 import json
+from functools import lru_cache
 from types import SimpleNamespace
 
+cloudpickle_exists = True
+try:
+    import cloudpickle
+except ImportError:
+    cloudpickle_exists = False
+
 no_notebook = False
 try:
     from IPython import get_ipython  # noqa
@@ -56,6 +65,68 @@ def get_workbench_path(port):
         return None
 
 
+def _dump_cloudpickle(obj, file):
+    """Pickle obj at protocol 5, writing large buffers out-of-band
+
+    The file holds the pickle payload followed by the concatenated
+    out-of-band buffers, so a pin stays a single artifact.
+
+    Parameters
+    ----------
+    obj:
+        Object to pickle, usually a trained model
+    file:
+        Path to write to
+
+    Returns
+    -------
+    tuple[int, list[int]]
+        Size of the pickle payload and of each out-of-band buffer,
+        needed to split the file apart again at load time
+    """
+    buffers = []
+    payload = cloudpickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+
+    sizes = []
+    with open(file, "wb") as f:
+        f.write(payload)
+        for buffer in buffers:
+            view = memoryview(buffer)
+            data = view.cast("B") if view.c_contiguous else view.tobytes()
+            sizes.append(len(data))
+            f.write(data)
+
+    return len(payload), sizes
+
+
+def _load_cloudpickle(file, payload_size, buffer_sizes):
+    """Load a protocol 5 pickle, memory-mapping its out-of-band buffers
+
+    The buffer region is mmap'd, so model arrays reference the page cache
+    directly instead of being copied into each process, and can be shared
+    between workers in multi-process deployments.
+    """
+    with open(file, "rb") as f:
+        if not buffer_sizes:
+            return pickle.loads(f.read())
+
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        payload = bytes(view[:payload_size])
+
+        buffers = []
+        offset = payload_size
+        for size in buffer_sizes:
+            end = offset + size
+            buffers.append(view[offset:end])
+            offset = end
+
+        return pickle.loads(payload, buffers=buffers)
+
+
+# the serialized schema is a pure function of the prototype class, so repeat
+# pin writes of the same model skip the pydantic schema generation
+@lru_cache(maxsize=16)
 def serialize_prototype(prototype):
     try:
         schema = prototype.model_json_schema().get("properties")
@@ -1,6 +1,20 @@
 import json
+import joblib
 from warnings import warn
+from pins.config import PINS_ENV_INSECURE_READ, get_allow_pickle_read
+from pins.errors import PinsInsecureReadError
 from vetiver.handlers.base import create_handler
+from vetiver.utils import _load_cloudpickle
+
+
+def _check_allow_pickle_read(board):
+    # downloaded pins bypass board.pin_read, so apply the same pickle gate here
+    if not get_allow_pickle_read(getattr(board, "allow_pickle_read", None)):
+        raise PinsInsecureReadError(
+            "Reading this pin involves reading a pickle file, so is NOT secure. "
+            "Set allow_pickle_read=True when creating the board, or the "
+            f"{PINS_ENV_INSECURE_READ}=1 environment variable."
+        )
 
 
 class NoModelAvailableError(Exception):
@@ -107,19 +121,40 @@ class VetiverModel:
         version : str
             What model version should be loaded
         """
-        model = board.pin_read(name, version)
         meta = board.pin_meta(name, version)
 
         if "vetiver_meta" in meta.user:
-            get_prototype = meta.user.get("vetiver_meta").get("prototype", None)
-            required_pkgs = meta.user.get("vetiver_meta").get("required_pkgs", None)
-            python_version = meta.user.get("vetiver_meta").get("python_version", None)
+            vetiver_meta = meta.user.get("vetiver_meta")
+            get_prototype = vetiver_meta.get("prototype", None)
+            required_pkgs = vetiver_meta.get("required_pkgs", None)
+            python_version = vetiver_meta.get("python_version", None)
+            serializer = vetiver_meta.get("serializer", "joblib")
+            payload_size = vetiver_meta.get("payload_size", None)
+            buffer_sizes = vetiver_meta.get("buffer_sizes", None)
+            compressed = vetiver_meta.get("compress", False)
             meta.user.pop("vetiver_meta")
         # old pin type
         else:
             get_prototype = meta.user.get("ptype")
             required_pkgs = meta.user.get("required_pkgs")
             python_version = meta.user.get("python_version")
+            serializer = "joblib"
+            payload_size = None
+            buffer_sizes = None
+            compressed = False
+
+        if serializer == "cloudpickle":
+            _check_allow_pickle_read(board)
+            (pkl_file,) = board.pin_download(name, version)
+            model = _load_cloudpickle(pkl_file, payload_size, buffer_sizes)
+        elif meta.type == "file":
+            # a joblib dump uploaded with options; uncompressed dumps are
+            # memory-mapped so workers share the model arrays
+            _check_allow_pickle_read(board)
+            (joblib_file,) = board.pin_download(name, version)
+            model = joblib.load(joblib_file, mmap_mode=None if compressed else "r")
+        else:
+            model = board.pin_read(name, version)
 
         return cls(
             model=model,